@@ -42,6 +42,10 @@ from usfm_references.reference import Reference
             "GEN.1.3+GEN.1.1",
             Reference(book="GEN", chapter=1, verses=[(1, 1), (3, 3)]),
         ),
+        (
+            "GEN.1.5-9+GEN.1.1-2+GEN.1.3+GEN.1.6-7+GEN.1.11",
+            Reference(book="GEN", chapter=1, verses=[(1, 3), (5, 9), (11, 11)]),
+        ),
         (
             "GEN",
             Reference(book="GEN"),
@@ -59,10 +63,17 @@ def test_reference_from_string(string, reference):
         "",
         "GEN.-1.1",
         "GEN.1+GEN.2",
+        "GEN.1.1+",
+        "GEN.1.1++GEN.1.2",
         "GEN.1.2-1",
         "GEN.1.a",
         "GEN.1_A",
         "GEN.INTROA",
+        "GEN.INTRO0",
+        "GEN.INTRO1.1",
+        "GEN.1_0",
+        "GEN.1.1.1",
+        "GEN.",
         "GENE.1.1",
     ],
 )
@@ -123,4 +134,14 @@ def test_methods():
         Reference(book="GEN", chapter=1, verses=[(3, 3)]),
         Reference(book="GEN", chapter=1, verses=[(5, 5)]),
     ]
+    assert list(reference.iter_single_verses()) == [
+        ("GEN", 1, 0, 0, 1),
+        ("GEN", 1, 0, 0, 2),
+        ("GEN", 1, 0, 0, 3),
+        ("GEN", 1, 0, 0, 5),
+    ]
+    assert reference.verse_count() == 4
+    assert Reference.from_string("GEN.1").verse_count() == 0
     assert reference.canon == "ot"
+    assert Reference.from_string("MAT.1").canon == "nt"
+    assert Reference(book="TOB", chapter=1).canon == "ap"
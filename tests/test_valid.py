@@ -8,6 +8,7 @@ from usfm_references import (
     valid_multi_usfm,
     valid_passage,
     valid_usfm,
+    valid_usfm_batch,
     valid_verse,
 )
 
@@ -74,6 +75,14 @@ def test_valid_usfm(ref, expect):
     assert valid_usfm(ref) == expect
 
 
+def test_valid_usfm_batch():
+    """Test batch reference validation."""
+    refs = ["GEN.1.1", "ZZZ.1.1", "GEN", "Gen.1.1", "GEN.1.1"]
+    assert valid_usfm_batch(refs) == [True, False, True, False, True]
+    assert valid_usfm_batch(ref for ref in refs) == [valid_usfm(ref) for ref in refs]
+    assert not valid_usfm_batch([])
+
+
 @pytest.mark.parametrize(
     "ref,expect",
     [
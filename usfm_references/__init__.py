@@ -3,7 +3,8 @@ USFM References Tools
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional
 
 from usfm_references.books import (
     BOOK_CANON,
@@ -21,6 +22,7 @@ __version__ = "3.1.1"
 
 _NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]")
 _LEADING_DIGITS = re.compile(r"^(\d+)(.+)$")
+_CANON_GET = BOOK_CANON.get
 
 
 def _split_leading_ordinal(key):
@@ -47,7 +49,7 @@ def _split_leading_ordinal(key):
 
 def convert_book_to_canon(book: str) -> str:
     """Return the canon category of a book (e.g., "ot", "nt", "ap")."""
-    return BOOK_CANON.get(book, "ap")
+    return _CANON_GET(book, "ap")
 
 
 def convert_book_name_to_usfm(name: str) -> Optional[str]:
@@ -64,7 +66,7 @@ def convert_book_name_to_usfm(name: str) -> Optional[str]:
     if not name:
         return None
     stripped = name.strip()
-    if stripped in BOOKS:
+    if stripped in BOOK_CANON:
         return stripped
     key = _NON_ALPHANUMERIC.sub("", stripped.lower())
     if not key:
@@ -81,6 +83,20 @@ def convert_book_name_to_usfm(name: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=16384)
+def _parse_cached(ref: str) -> Optional[Reference]:
+    """
+    Parse a reference string for the validators, returning None when it is invalid.
+
+    Results (including failures) are memoized per distinct string, so the returned
+    Reference is shared between calls and must only be read, never mutated.
+    """
+    try:
+        return Reference.from_string(ref)
+    except ValueError:
+        return None
+
+
 def valid_chapter(ref: str) -> bool:
     """
     Succeeds if the given string is a validly structured USFM Bible chapter reference.
@@ -88,10 +104,8 @@ def valid_chapter(ref: str) -> bool:
         followed by a period (.) and a (chapter) number of any length,
         optionally followed by an underscore (_) and a (sub-chapter?) number of any length.
     """
-    try:
-        return Reference.from_string(ref).is_chapter()
-    except ValueError:
-        return False
+    reference = _parse_cached(ref)
+    return reference is not None and reference.is_chapter()
 
 
 def valid_chapter_or_intro(ref: str) -> bool:
@@ -103,11 +117,8 @@ def valid_chapter_or_intro(ref: str) -> bool:
     OR
         followed by a period (.) and INTRO, followed by a number
     """
-    try:
-        reference = Reference.from_string(ref)
-        return reference.is_chapter() or reference.is_intro()
-    except ValueError:
-        return False
+    reference = _parse_cached(ref)
+    return reference is not None and (reference.is_chapter() or reference.is_intro())
 
 
 def valid_usfm(ref: str) -> bool:
@@ -118,11 +129,18 @@ def valid_usfm(ref: str) -> bool:
         optionally followed by an underscore (_) and a (sub-chapter?) number of any length,
         optionally followed by a period (.) and a (verse) number of any length.
     """
-    try:
-        Reference.from_string(ref)
-        return True
-    except ValueError:
-        return False
+    return _parse_cached(ref) is not None
+
+
+def valid_usfm_batch(refs: Iterable[str]) -> list[bool]:
+    """
+    Validate many USFM Bible references at once, returning one result per input.
+
+    Equivalent to ``[valid_usfm(ref) for ref in refs]`` but binds the parser once for
+    the whole batch; prefer it over calling valid_usfm in a loop.
+    """
+    parse = _parse_cached
+    return [parse(ref) is not None for ref in refs]
 
 
 def valid_verse(ref: str) -> bool:
@@ -133,10 +151,8 @@ def valid_verse(ref: str) -> bool:
         optionally followed by an underscore (_) and a (sub-chapter?) number of any length,
         optionally followed by a period (.) and a (verse) number of any length.
     """
-    try:
-        return Reference.from_string(ref).is_single_verse()
-    except ValueError:
-        return False
+    reference = _parse_cached(ref)
+    return reference is not None and reference.is_single_verse()
 
 
 def valid_multi_usfm(ref: str, delimiter: str = "+") -> bool:
@@ -150,11 +166,8 @@ def valid_multi_usfm(ref: str, delimiter: str = "+") -> bool:
     Example Multi USFM ref (James1:1-5): JAS.1.1+JAS.1.2+JAS.1.3+JAS.1.4+JAS.1.5
     Another Example with COMMA delimiter: JAS.1.1,JAS.1.2,JAS.1.3,JAS.1.4,JAS.1.5
     """
-    try:
-        reference = Reference.from_string(ref.replace(delimiter, "+"))
-        return len(reference.to_single_verses()) > 1
-    except ValueError:
-        return False
+    reference = _parse_cached(ref.replace(delimiter, "+"))
+    return reference is not None and reference.verse_count() > 1
 
 
 def valid_passage(passage: str) -> bool:
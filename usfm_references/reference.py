@@ -1,11 +1,68 @@
 """Reference class for parsing and representing USFM scripture references."""
 
+import re
+import sys
 from dataclasses import dataclass, field
+from itertools import chain
+from typing import Iterator, Optional
 
 from usfm_references.books import BOOK_CANON, BOOKS
 
+# Bound once so the hot paths skip the global + attribute lookups; BOOKS is a list.
+_BOOKS: frozenset[str] = frozenset(BOOKS)
+_CANON_GET = BOOK_CANON.get
 
-@dataclass
+# BOOK[.INTRO<n> | .CHAPTER[_SECTION][.VERSE[-VERSE]]], matched in a single pass.
+# Numeric bounds are checked after the match so error messages stay specific.
+_USFM_RE = re.compile(r"([0-9A-Z]{3})(?:\.(?:INTRO(\d+)|(\d+)(?:_(\d+))?(?:\.(\d+)(?:-(\d+))?)?))?")
+_USFM_MATCH = _USFM_RE.fullmatch
+
+# Slotted dataclasses need Python 3.10+; on 3.9 instances fall back to a __dict__.
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _parse_fields(s: str) -> tuple[tuple[str, int, int, int], Optional[tuple[int, int]]]:
+    """
+    Parse a single (non '+'-joined) USFM reference into plain values.
+
+    Returns ``((book, chapter, section, intro), verse_range)``, where ``verse_range`` is a
+    ``(start, end)`` tuple or None. Raises ValueError if the reference is invalid.
+    """
+    match = _USFM_MATCH(s)
+    if match is None:
+        raise ValueError(f"invalid USFM code {s}")
+
+    book, intro_str, chapter_str, section_str, start_str, end_str = match.groups()
+    if book not in _BOOKS:
+        raise ValueError(f"invalid USFM book code {book}")
+
+    if intro_str is not None:
+        intro = int(intro_str)
+        if intro < 1:
+            raise ValueError(f"invalid intro reference {s}")
+        return (book, 0, 0, intro), None
+    if chapter_str is None:
+        return (book, 0, 0, 0), None
+
+    chapter = int(chapter_str)
+    if not 1 <= chapter < 1000:
+        raise ValueError(f"invalid chapter {s}")
+    section = 0
+    if section_str is not None:
+        section = int(section_str)
+        if section < 1:
+            raise ValueError(f"invalid section {s}")
+
+    if start_str is None:
+        return (book, chapter, section, 0), None
+    start = int(start_str)
+    end = start if end_str is None else int(end_str)
+    if not 1 <= start <= end < 1000:
+        raise ValueError(f"invalid verse range {s}")
+    return (book, chapter, section, 0), (start, end)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Reference:
     """
     Represents a USFM reference, including book, chapter, section, intro, and verse ranges.
@@ -34,103 +91,98 @@ class Reference:
     section: int = 0
     intro: int = 0
     verses: list[tuple[int, int]] = field(default_factory=list)
+    # Resolved once at construction; the book is not expected to change afterwards.
+    _canon: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        self._canon = _CANON_GET(self.book, "ap")
         self._normalize_verses()
 
+    @classmethod
+    def _make(
+        cls,
+        book: str,
+        chapter: int = 0,
+        section: int = 0,
+        intro: int = 0,
+        verses: Optional[list[tuple[int, int]]] = None,
+    ) -> "Reference":
+        """Build a Reference whose verses are already normalized, skipping __post_init__."""
+        ref = cls.__new__(cls)
+        ref.book = book
+        ref.chapter = chapter
+        ref.section = section
+        ref.intro = intro
+        ref.verses = [] if verses is None else verses
+        ref._canon = _CANON_GET(book, "ap")
+        return ref
+
     @classmethod
     def from_string(cls, s: str) -> "Reference":
         """Parse a USFM reference string and return a Reference object."""
         s = s.strip()
         if not s:
             raise ValueError("empty reference")
+        pos = s.find("+")
+        if pos < 0:
+            # A single part holds at most one verse range, so it is already normalized.
+            return cls._parse_single(s)
 
-        parts = s.split("+")
-        ref = cls._parse_single(parts[0])
+        ref = cls._parse_single(s[:pos])
         is_full_chapter = ref.is_chapter()
-
-        for part in parts[1:]:
-            new_ref = cls._parse_single(part)
-            if new_ref.is_chapter():
-                is_full_chapter = True
-            if ref.to_chapter_or_intro() != new_ref.to_chapter_or_intro():
+        key = (ref.book, ref.chapter, ref.section, ref.intro)
+        verses = ref.verses
+
+        # Walk the '+' separators by index rather than materializing a list of parts, and
+        # compare each part's identity tuple without building a Reference for it.
+        while pos >= 0:
+            start = pos + 1
+            pos = s.find("+", start)
+            part_key, verse_range = _parse_fields(s[start:] if pos < 0 else s[start:pos])
+            if part_key != key:
                 raise ValueError("references must be in the same chapter")
-            ref.verses.extend(new_ref.verses)
+            if verse_range is not None:
+                verses.append(verse_range)
+            elif part_key[1]:
+                is_full_chapter = True
 
         ref._normalize_verses()
         return ref.to_chapter_or_intro() if is_full_chapter else ref
 
     @classmethod
     def _parse_single(cls, s: str) -> "Reference":
-        parts = s.split(".")
-        if len(parts) not in (1, 2, 3):
-            raise ValueError(f"invalid USFM code {s}")
-
-        book = parts[0]
-        if len(book) != 3 or book not in BOOKS:
-            raise ValueError(f"invalid USFM book code {book}")
-
-        ref = cls(book=book)
-        if len(parts) == 1:
-            return ref
-
-        ref._parse_chapter(parts[1])
-        if len(parts) == 3:
-            ref._parse_verse_range(parts[2])
-        return ref
-
-    def _parse_chapter(self, chapter_str: str) -> None:
-        if chapter_str.startswith("INTRO"):
-            num = chapter_str.removeprefix("INTRO")
-            if not num.isdigit() or int(num) < 1:
-                raise ValueError(f"invalid intro reference {chapter_str}")
-            self.intro = int(num)
-            return
-
-        # chapter[_section]
-        parts = chapter_str.split("_", 1)
-        if not parts[0].isdigit() or not 1 <= int(parts[0]) < 1000:
-            raise ValueError(f"invalid chapter {chapter_str}")
-        self.chapter = int(parts[0])
-
-        if len(parts) == 2:
-            if not parts[1].isdigit() or int(parts[1]) < 1:
-                raise ValueError(f"invalid section {chapter_str}")
-            self.section = int(parts[1])
-
-    def _parse_verse_range(self, verse_str: str) -> None:
-        parts = verse_str.split("-", 1)
-        if not parts[0].isdigit():
-            raise ValueError(f"invalid verse range {verse_str}")
-        start = int(parts[0])
-        if len(parts) == 2:
-            if not parts[1].isdigit():
-                raise ValueError(f"invalid verse range {verse_str}")
-            end = int(parts[1])
-        else:
-            end = start
-        if not 1 <= start <= end < 1000:
-            raise ValueError(f"invalid verse range {verse_str}")
-        self.verses.append((start, end))
+        (book, chapter, section, intro), verse_range = _parse_fields(s)
+        return cls._make(
+            book, chapter, section, intro, None if verse_range is None else [verse_range]
+        )
 
     def _normalize_verses(self) -> None:
-        if not self.verses:
+        verses = self.verses
+        if len(verses) <= 1:
             return
-        self.verses.sort()
-        merged = [self.verses[0]]
-        for start, end in self.verses[1:]:
-            last_start, last_end = merged[-1]
-            if start <= last_end + 1:
-                merged[-1] = (last_start, max(last_end, end))
+        verses.sort()
+        # Sweep with the current merge target held as ints, writing each finished
+        # range back in place and truncating the tail at the end.
+        write = 0
+        cur_start, cur_end = verses[0]
+        for i in range(1, len(verses)):
+            start, end = verses[i]
+            if start <= cur_end + 1:
+                cur_end = max(cur_end, end)
             else:
-                merged.append((start, end))
-        self.verses = merged
+                verses[write] = (cur_start, cur_end)
+                write += 1
+                cur_start, cur_end = start, end
+        verses[write] = (cur_start, cur_end)
+        del verses[write + 1 :]
 
     def __str__(self):
         """Return the USFM string representation of the reference."""
         if self.verses:
-            ranges = [f"{s}" if s == e else f"{s}-{e}" for (s, e) in self.verses]
-            return "+".join(f"{self.book}.{self._chapter_str()}.{r}" for r in ranges)
+            prefix = f"{self.book}.{self._chapter_str()}"
+            return "+".join(
+                f"{prefix}.{s}" if s == e else f"{prefix}.{s}-{e}" for (s, e) in self.verses
+            )
         if self.chapter:
             return f"{self.book}.{self._chapter_str()}"
         if self.intro:
@@ -142,17 +194,6 @@ class Reference:
     def _chapter_str(self) -> str:
         return f"{self.chapter}" + ("_" + str(self.section) if self.section else "")
 
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, Reference):  # pragma: no cover
-            return False
-        return (
-            self.book == other.book
-            and self.chapter == other.chapter
-            and self.section == other.section
-            and self.intro == other.intro
-            and self.verses == other.verses
-        )
-
     def is_chapter(self) -> bool:
         """Return True if the reference is a whole chapter."""
         return self.chapter > 0 and not self.verses
@@ -169,43 +210,41 @@ class Reference:
         """Return True if the reference is a verse range."""
         return self.chapter > 0 and len(self.verses) == 1 and self.verses[0][0] != self.verses[0][1]
 
+    def verse_count(self) -> int:
+        """Return the number of verses covered by the reference's verse ranges."""
+        return sum(e - s + 1 for s, e in self.verses)
+
     def to_chapter_or_intro(self) -> "Reference":
         """Return a Reference object representing only the chapter or intro (no verses)."""
-        return Reference(
-            book=self.book,
-            chapter=self.chapter,
-            section=self.section,
-            intro=self.intro,
-        )
+        return Reference._make(self.book, self.chapter, self.section, self.intro)
 
     def to_single_verses(self) -> list["Reference"]:
         """Return a list of Reference objects, each for a single verse."""
+        make = Reference._make
+        book, chapter, section, intro = self.book, self.chapter, self.section, self.intro
         return [
-            Reference(
-                book=self.book,
-                chapter=self.chapter,
-                section=self.section,
-                intro=self.intro,
-                verses=[(v, v)],
-            )
-            for s, e in self.verses
-            for v in range(s, e + 1)
+            make(book, chapter, section, intro, [(v, v)])
+            for v in chain.from_iterable(range(s, e + 1) for s, e in self.verses)
         ]
 
+    def iter_single_verses(self) -> Iterator[tuple[str, int, int, int, int]]:
+        """
+        Yield a (book, chapter, section, intro, verse) tuple for each single verse.
+
+        A lighter alternative to to_single_verses() when Reference objects aren't needed.
+        """
+        book, chapter, section, intro = self.book, self.chapter, self.section, self.intro
+        for s, e in self.verses:
+            for v in range(s, e + 1):
+                yield (book, chapter, section, intro, v)
+
     def to_verse_ranges(self) -> list["Reference"]:
         """Return a list of Reference objects, each for a single verse range."""
-        return [
-            Reference(
-                book=self.book,
-                chapter=self.chapter,
-                section=self.section,
-                intro=self.intro,
-                verses=[r],
-            )
-            for r in self.verses
-        ]
+        make = Reference._make
+        book, chapter, section, intro = self.book, self.chapter, self.section, self.intro
+        return [make(book, chapter, section, intro, [r]) for r in self.verses]
 
     @property
     def canon(self) -> str:
         """Return the canon category of the book (e.g., "ot", "nt", "ap")."""
-        return BOOK_CANON.get(self.book, "ap")
+        return self._canon